@@ -28,6 +28,7 @@ VECTOR_DB_PATH = CHROMA_DB_PATH  # Alias for backward compatibility
 # RAG Configuration
 MAX_RETRIEVED_CHUNKS = 3
 MAX_TOKENS = 1000
+MAX_HISTORY_TOKENS = 1024  # Conversation history is cut to this many trailing tokens before prompting
 
 # Static Files and Documents
 STATIC_DIR = "./static"
@@ -3,6 +3,7 @@ RAG (Retrieval-Augmented Generation) system for enhanced query answering
 """
 
 import os
+import re
 import time
 import traceback
 import json
@@ -10,11 +11,50 @@ import base64
 from datetime import datetime
 from typing import List, Optional, Dict, Any, BinaryIO, Union
 
-from processors.document_processor import DocumentProcessor
+from processors.document_processor import DocumentProcessor, PDF_DIRECT_PROCESS_MESSAGE
 from core.vector_store import VectorStore
-from utils.prompts import Prompts
+from utils.prompts import Prompts, FILE_TEXT_LIMIT
 from core.llm_client import LLMClient
-from config.settings import VECTOR_DB_PATH, CHUNK_SIZE, CHUNK_OVERLAP, MAX_RETRIEVED_CHUNKS
+from utils.token_utils import truncate_to_tokens
+from config.settings import VECTOR_DB_PATH, CHUNK_SIZE, CHUNK_OVERLAP, MAX_RETRIEVED_CHUNKS, MAX_HISTORY_TOKENS
+
+# Keyword lists for the heuristic medical/non-medical check and medical context enrichment.
+# MEDICAL_KEYWORDS / MEDICAL_RE are the single definition; the web routes import them too.
+MEDICAL_KEYWORDS = ("health", "medicine", "doctor", "hospital", "disease", "condition",
+                    "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
+                    "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing",
+                    "blood", "heart", "lungs", "brain", "liver", "kidney", "ph level", "hp",
+                    "immune", "diet", "nutrition", "cancer", "diabetes", "virus", "bacterial",
+                    "infection", "prescription", "prognosis", "chronic", "acute")
+
+NON_MEDICAL_KEYWORDS = ("computer", "programming", "gaming", "video game", "sports", "politics",
+                        "entertainment", "movies", "celebrity", "stock market", "finance",
+                        "cooking", "recipes", "travel", "vacation", "cars", "fashion",
+                        "technology", "crypto", "weather", "news", "music", "art", "books")
+
+# Smaller list used when repairing empty or invalid answers; order is kept because matched terms go into the prompt
+FALLBACK_MEDICAL_KEYWORDS = ("health", "medicine", "doctor", "hospital", "disease", "condition",
+                             "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
+                             "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing",
+                             "hp level", "human body", "blood", "heart", "lungs", "brain", "liver")
+
+# Both lists match whole words only, so "art" doesn't hit "artery" and "condition" doesn't hit
+# "air conditioning"; medical terms also take a plural "s" so "symptoms" still counts
+MEDICAL_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, MEDICAL_KEYWORDS)) + r")s?\b", re.IGNORECASE)
+_FALLBACK_MEDICAL_RE = re.compile("|".join(map(re.escape, FALLBACK_MEDICAL_KEYWORDS)), re.IGNORECASE)
+_NON_MEDICAL_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, NON_MEDICAL_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+def is_clearly_non_medical(question: str) -> bool:
+    """
+    Cheap keyword check for questions that are plainly off-topic
+    
+    Args:
+        question (str): The user's question
+        
+    Returns:
+        bool: True if the question names a non-medical topic and no medical term
+    """
+    return _NON_MEDICAL_RE.search(question) is not None and MEDICAL_RE.search(question) is None
 
 class RAGSystem:
     """
@@ -46,12 +86,7 @@ class RAGSystem:
         Returns:
             Formatted conversation history string
         """
-        if session_id not in self.conversation_histories:
-            # Try to load from disk first
-            if not self.load_conversation(session_id):
-                self.conversation_histories[session_id] = []
-            
-        history = self.conversation_histories[session_id]
+        history = self._get_history_entries(session_id)
         
         # Format the history as a string
         formatted_history = ""
@@ -61,6 +96,26 @@ class RAGSystem:
             
         return formatted_history
     
+    def get_message_count(self, session_id: str = "default") -> int:
+        """
+        Get the number of exchanges stored for a session without formatting the history
+        
+        Args:
+            session_id: Unique identifier for the conversation session
+            
+        Returns:
+            Number of question/answer pairs in the session history
+        """
+        return len(self._get_history_entries(session_id))
+    
+    def _get_history_entries(self, session_id: str) -> list:
+        """Return the stored history entries for a session, loading them from disk on first use"""
+        if session_id not in self.conversation_histories:
+            # Try to load from disk first
+            if not self.load_conversation(session_id):
+                self.conversation_histories[session_id] = []
+        return self.conversation_histories[session_id]
+    
     def add_to_conversation_history(self, 
                                   question: str, 
                                   answer: str, 
@@ -119,24 +174,12 @@ class RAGSystem:
             Dict[str, Any]: Result with answer and metadata
         """
         try: 
-            # Get conversation history for this session
-            conversation_history = self.get_conversation_history(session_id)
+            # Get conversation history for this session, bounded so prompt size doesn't grow with the chat
+            conversation_history = truncate_to_tokens(
+                self.get_conversation_history(session_id), MAX_HISTORY_TOKENS
+            )
             
             # First, determine if this is a medical or non-medical question
-            # Define keyword lists for fallback use and medical context enrichment
-            medical_keywords = ["health", "medicine", "doctor", "hospital", "disease", "condition",
-                              "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
-                              "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing",
-                              "blood", "heart", "lungs", "brain", "liver", "kidney", "ph level", "hp",
-                              "immune", "diet", "nutrition", "cancer", "diabetes", "virus", "bacterial",
-                              "infection", "prescription", "diagnosis", "prognosis", "chronic", "acute"]
-
-            # Non-medical keywords list for heuristic fallback
-            non_medical_keywords = ["computer", "programming", "gaming", "video game", "sports", "politics",
-                                  "entertainment", "movies", "celebrity", "stock market", "finance",
-                                  "cooking", "recipes", "travel", "vacation", "cars", "fashion",
-                                  "technology", "crypto", "weather", "news", "music", "art", "books"]
-
             # Primary classification using LLM
             classification = self.llm_client.classify_query(question)
             is_medical = classification == "medical"
@@ -144,9 +187,8 @@ class RAGSystem:
 
             # Fallback to keyword heuristics if LLM classification is unavailable
             if classification is None:
-                is_non_medical = any(keyword in question.lower() for keyword in non_medical_keywords) and \
-                                not any(keyword in question.lower() for keyword in medical_keywords)
-                is_medical = any(keyword in question.lower() for keyword in medical_keywords)
+                is_non_medical = is_clearly_non_medical(question)
+                is_medical = MEDICAL_RE.search(question) is not None
 
             # If it's a non-medical question, return early with a polite response
             if is_non_medical:
@@ -207,7 +249,7 @@ class RAGSystem:
                 print("Insufficient RAG context for medical question, generating medical response...")
                 
                 # Extract key medical terms for more focused response
-                medical_terms = [term for term in medical_keywords if term in question.lower()]
+                medical_terms = list(dict.fromkeys(term.lower() for term in MEDICAL_RE.findall(question)))
                 medical_context = ", ".join(medical_terms) if medical_terms else "general medical knowledge"
                 
                 # For RAG with limited context, include whatever context we have
@@ -316,11 +358,6 @@ Answer:"""
             
             # Try to generate a fallback response
             try:
-                # Define medical keywords here for exception handler
-                medical_keywords = ["health", "medicine", "doctor", "hospital", "disease", "condition", 
-                                  "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
-                                  "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing"]
-                
                 # Check if likely medical question
                 is_medical =True
                 
@@ -418,52 +455,36 @@ Answer:"""
                     "error": "Unsupported file format"
                 }
             
-            # Reset file pointer and read the data
-            file_object.seek(0)
-            file_data = file_object.read()
-            
-            # Create temp directory if needed
-            temp_dir = "temp_uploads"
-            os.makedirs(temp_dir, exist_ok=True)
-            temp_path = os.path.join(temp_dir, os.path.basename(filename))
-            
-            # Save the file temporarily
-            with open(temp_path, 'wb') as f:
-                f.write(file_data)
-            
-            try:
-                # Process based on file type
-                if ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff']:
-                    # For image files, use direct image processing
-                    from processors.direct_image_processor import DirectImageProcessor
-                    result = DirectImageProcessor.process_image(
-                        file_object, question, prompt_type, self.llm_client, conversation_history
+            # Process based on file type, reading straight from the upload rather than a temp copy
+            if ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff']:
+                # For image files, use direct image processing
+                from processors.direct_image_processor import DirectImageProcessor
+                result = DirectImageProcessor.process_image(
+                    file_object, question, prompt_type, self.llm_client, conversation_history
+                )
+                answer = result["answer"]
+            else:
+                # For PDFs, extract text from the uploaded stream
+                file_object.seek(0)
+                file_text = self.doc_processor.load_pdf(getattr(file_object, 'stream', file_object))
+                is_direct_process = file_text == PDF_DIRECT_PROCESS_MESSAGE
+                file_text = file_text[:FILE_TEXT_LIMIT]
+                
+                # Generate prompt based on text and conversation history
+                if question:
+                    prompt = self.prompts.file_analysis_prompt(
+                        file_text, question, prompt_type, conversation_history,
+                        is_direct_process=is_direct_process, truncated=True
                     )
-                    answer = result["answer"]
                 else:
-                    # For PDFs, extract text
-                    file_text = self.doc_processor.load_pdf(temp_path)
-                    
-                    # Generate prompt based on text and conversation history
-                    if question:
-                        prompt = self.prompts.file_analysis_prompt(
-                            file_text, question, prompt_type, conversation_history
-                        )
-                    else:
-                        prompt = self.prompts.file_summary_prompt(
-                            file_text, prompt_type, conversation_history
-                        )
-                    
-                    # Generate response using LLM
-                    print("\nGenerating response from PDF content...")
-                    answer = self.llm_client.generate_response(prompt)
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except:
-                        pass
+                    prompt = self.prompts.file_summary_prompt(
+                        file_text, prompt_type, conversation_history,
+                        is_direct_process=is_direct_process, truncated=True
+                    )
+                
+                # Generate response using LLM
+                print("\nGenerating response from PDF content...")
+                answer = self.llm_client.generate_response(prompt)
             
             # Handle empty responses
             if not answer or answer.strip() == "":
@@ -672,14 +693,9 @@ Answer:"""
             "not enough information"
         ]
         
-        # Medical-related keywords to detect medical questions
-        medical_keywords = ["health", "medicine", "doctor", "hospital", "disease", "condition", 
-                          "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
-                          "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing",
-                          "hp level", "human body", "blood", "heart", "lungs", "brain", "liver"]
-                          
         # Check if this is likely a medical question
-        is_medical_question = any(keyword in question.lower() for keyword in medical_keywords)
+        question_lower = question.lower()
+        is_medical_question = _FALLBACK_MEDICAL_RE.search(question) is not None
         
         answer_lower = answer.lower() if answer else ""
         
@@ -692,7 +708,7 @@ Answer:"""
                 print(f"Generating medical response for: {question}")
                 
                 # Extract key medical terms for more specific response
-                medical_terms = [term for term in medical_keywords if term in question.lower()]
+                medical_terms = [term for term in FALLBACK_MEDICAL_KEYWORDS if term in question_lower]
                 medical_context = ", ".join(medical_terms) if medical_terms else "general medical knowledge"
                 
                 fallback_prompt = f"""You are a medical assistant with extensive knowledge. 
@@ -2,10 +2,16 @@
 Vector database operations using ChromaDB
 """
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import chromadb
 from typing import List, Dict, Any, Optional
 from config.settings import COLLECTION_NAME, CHROMA_DB_PATH
 
+# Most concurrent searches folded into a single collection.query call
+MAX_SEARCH_BATCH = 16
+
 
 class VectorStore:
     """Handle vector database operations"""
@@ -25,6 +31,13 @@ class VectorStore:
         self.collection_name = COLLECTION_NAME
         self.collection = None
         self._ensure_collection_exists()
+        
+        # Searches are queued and run by one worker thread; those that arrive while a batch is
+        # running go into the next batch together
+        self._search_lock = threading.Lock()
+        self._pending_searches = []
+        self._search_running = False
+        self._search_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-search")
     
     def _ensure_collection_exists(self):
         """Ensure collection exists and is accessible"""
@@ -97,6 +110,9 @@ class VectorStore:
         """
         Search for similar documents (compatibility method)
         
+        Concurrent callers are coalesced: queries that arrive while a batch is running
+        are embedded and searched together in the next one.
+        
         Args:
             query (str): Query string
             k (int): Number of results to return
@@ -104,35 +120,79 @@ class VectorStore:
         Returns:
             List[Dict[str, Any]]: List of document data with similarity scores
         """
-        # Ensure collection exists
-        self._ensure_collection_exists()
+        future = Future()
+        with self._search_lock:
+            self._pending_searches.append((query, k, future))
+            if not self._search_running:
+                self._search_running = True
+                self._search_worker.submit(self._run_search_batch)
         
         try:
-            # Query the collection
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=k,
-                include=["documents", "metadatas", "distances"]
-            )
+            return future.result()
+        except Exception as e:
+            print(f"Error searching collection: {e}")
+            return []
+    
+    def _run_search_batch(self):
+        """Run one batch of queued searches, then schedule the next batch if more are waiting"""
+        with self._search_lock:
+            batch = self._pending_searches[:MAX_SEARCH_BATCH]
+            del self._pending_searches[:MAX_SEARCH_BATCH]
+        
+        try:
+            results = self.search_batch([q for q, _, _ in batch], max(k for _, k, _ in batch))
+        except Exception as e:
+            # Every caller in the batch sees the failure
+            for _, _, batch_future in batch:
+                batch_future.set_exception(e)
+        else:
+            for (_, batch_k, batch_future), result in zip(batch, results):
+                batch_future.set_result(result[:batch_k])
+        
+        with self._search_lock:
+            if self._pending_searches:
+                self._search_worker.submit(self._run_search_batch)
+            else:
+                self._search_running = False
+    
+    def search_batch(self, queries: List[str], k: int = 3) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar documents for several queries in a single collection query
+        
+        Args:
+            queries (List[str]): Query strings
+            k (int): Number of results to return per query
             
+        Returns:
+            List[List[Dict[str, Any]]]: One result list per query, in input order
+        """
+        # Ensure collection exists
+        self._ensure_collection_exists()
+        
+        # Query the collection; errors propagate so each caller can handle its own
+        results = self.collection.query(
+            query_texts=queries,
+            n_results=k,
+            include=["documents", "metadatas", "distances"]
+        )
+        
+        batch_results = []
+        for qi in range(len(queries)):
             formatted_results = []
             if results and "documents" in results and results["documents"]:
-                for i, doc in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i] if "metadatas" in results and results["metadatas"] and i < len(results["metadatas"][0]) else {}
-                    distance = results["distances"][0][i] if "distances" in results and results["distances"] and i < len(results["distances"][0]) else None
+                for i, doc in enumerate(results["documents"][qi]):
+                    metadata = results["metadatas"][qi][i] if "metadatas" in results and results["metadatas"] and i < len(results["metadatas"][qi]) else {}
+                    distance = results["distances"][qi][i] if "distances" in results and results["distances"] and i < len(results["distances"][qi]) else None
                     
                     formatted_results.append({
                         "content": doc,
                         "metadata": metadata,
                         "similarity": 1.0 - (distance or 0) if distance is not None else None
                     })
-            
-            print(f"Found {len(formatted_results)} matching documents")
-            return formatted_results
+            batch_results.append(formatted_results)
         
-        except Exception as e:
-            print(f"Error searching collection: {e}")
-            return []
+        print(f"Found {sum(map(len, batch_results))} matching documents for {len(queries)} queries")
+        return batch_results
     
     def add_text(self, text: str, metadata: Dict[str, Any] = None) -> str:
         """
@@ -5,7 +5,7 @@ Document processing utilities for RAG system
 import os
 import tempfile
 import io
-from typing import List, BinaryIO, Dict
+from typing import List, BinaryIO, Dict, Union
 import traceback
 
 # Import conditionally to handle environments without these dependencies
@@ -21,17 +21,23 @@ except ImportError:
     print("Warning: PIL not installed. Image processing will be unavailable.")
     Image = None
 
+# Returned by load_pdf when a PDF has too little text and should be handled directly by the AI
+PDF_DIRECT_PROCESS_MESSAGE = """
+This PDF appears to contain mostly images, scanned content, or limited text.
+For better results, the file will be processed directly by the AI.
+"""
+
 
 class DocumentProcessor:
     """Handle document loading and text extraction for various formats"""
     
     @staticmethod
-    def load_pdf(file_path: str) -> str:
+    def load_pdf(file_path: Union[str, BinaryIO]) -> str:
         """
         Load PDF and extract all text
         
         Args:
-            file_path (str): Path to the PDF file
+            file_path (str | BinaryIO): Path to the PDF file, or a seekable binary stream
             
         Returns:
             str: Extracted text from PDF
@@ -66,10 +72,7 @@ class DocumentProcessor:
             
             # If we couldn't extract meaningful text, return a message
             if not text or len(text.strip()) < 50:
-                return f"""
-This PDF appears to contain mostly images, scanned content, or limited text.
-For better results, the file will be processed directly by the AI.
-"""
+                return PDF_DIRECT_PROCESS_MESSAGE
             
             return text
             
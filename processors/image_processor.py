@@ -12,6 +12,24 @@ from io import BytesIO
 from openai import OpenAI
 from config.settings import OPENAI_API_KEY, OPENAI_MODEL
 
+# Magic-number signatures used to validate uploads and pick the data URL MIME type
+IMAGE_SIGNATURES = (
+    (b'\x89PNG', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF8', 'image/gif'),
+    (b'BM', 'image/bmp'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+)
+
+def detect_image_mime(image_data):
+    """Return the MIME type for image bytes based on their header, or None if unrecognized"""
+    header = image_data[:12]
+    for signature, mime in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    return None
+
 class ImageProcessor:
     """
     Handles direct processing of images with GPT-5-nano vision capabilities
@@ -39,22 +57,23 @@ class ImageProcessor:
             filename = getattr(file_object, 'filename', 'unknown_file')
             print(f"Processing image: {filename}")
             
-            # Determine file type
-            ext = os.path.splitext(filename)[1].lower() if filename else ''
+            # Reset file pointer and read the data
+            file_object.seek(0)
+            image_data = file_object.read()
+            
+            # Determine file type from the content itself so bad uploads never reach the API
+            mime_type = detect_image_mime(image_data)
             
-            if ext not in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff']:
+            if mime_type is None:
+                ext = os.path.splitext(filename)[1].lower() if filename else ''
                 return {
-                    "answer": f"Unsupported image format: {ext}. Please use PNG, JPG, JPEG, BMP, GIF, or TIFF.",
+                    "answer": f"Unsupported image format: {ext or 'unknown'}. Please use PNG, JPG, JPEG, BMP, GIF, or TIFF.",
                     "file_processed": True,
                     "success": False,
                     "error": "Unsupported format",
                     "query_time": time.time() - start_time
                 }
             
-            # Reset file pointer and read the data
-            file_object.seek(0)
-            image_data = file_object.read()
-            
             # Create OpenAI client
             client = OpenAI(api_key=OPENAI_API_KEY)
             
@@ -95,7 +114,7 @@ class ImageProcessor:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}"
+                                    "url": f"data:{mime_type};base64,{base64_image}"
                                 }
                             }
                         ]
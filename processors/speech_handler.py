@@ -2,10 +2,8 @@
 Speech handling module for text-to-speech and speech-to-text functionality
 """
 
-import os
-import base64
-import tempfile
-from typing import Dict, Any, Optional
+import io
+from typing import Dict, Any, Iterator, Optional
 
 # Import text-to-speech library - using gTTS as it's widely available
 try:
@@ -19,16 +17,16 @@ class SpeechHandler:
     """Handler for speech-related functionality"""
     
     @staticmethod
-    def text_to_speech(text: str, lang: str = 'en') -> Dict[str, Any]:
+    def synthesize(text: str, lang: str = 'en') -> Dict[str, Any]:
         """
-        Convert text to speech and return as base64 encoded audio
+        Convert text to speech and return the raw MP3 bytes
         
         Args:
             text (str): Text to convert to speech
             lang (str): Language code (default: 'en')
             
         Returns:
-            Dict: Result with audio data or error
+            Dict: Result with audio bytes or error
         """
         if not GTTS_AVAILABLE:
             return {
@@ -37,29 +35,15 @@ class SpeechHandler:
             }
             
         try:
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio:
-                temp_path = temp_audio.name
-            
-            # Generate speech using gTTS
+            # Generate speech using gTTS straight into memory, no temporary file needed
             tts = gTTS(text=text, lang=lang, slow=False)
-            tts.save(temp_path)
-            
-            # Read the generated audio file
-            with open(temp_path, 'rb') as audio_file:
-                audio_data = audio_file.read()
-            
-            # Encode audio data to base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
             
-            # Clean up the temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                
             return {
                 "success": True,
-                "audio_data": audio_base64,
-                "audio_type": "audio/mp3",
+                "audio_bytes": buffer.getvalue(),
+                "audio_type": "audio/mpeg",
                 "text": text
             }
             
@@ -68,4 +52,34 @@ class SpeechHandler:
             return {
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    @staticmethod
+    def stream(text: str, lang: str = 'en') -> Iterator[bytes]:
+        """
+        Convert text to speech, yielding MP3 data as each part of the text is synthesized
+        
+        gTTS fetches long texts in several parts; yielding each one lets playback start
+        after the first instead of after the whole clip.
+        
+        Args:
+            text (str): Text to convert to speech
+            lang (str): Language code (default: 'en')
+            
+        Yields:
+            bytes: Consecutive pieces of one MP3 stream
+            
+        Raises:
+            RuntimeError: If gTTS is not installed
+        """
+        if not GTTS_AVAILABLE:
+            raise RuntimeError("Text-to-speech functionality requires gTTS. Please install with: pip install gtts")
+        
+        tts = gTTS(text=text, lang=lang, slow=False)
+        if hasattr(tts, "stream"):
+            yield from tts.stream()
+        else:
+            # Older gTTS releases can only write the whole clip
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            yield buffer.getvalue()
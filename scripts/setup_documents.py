@@ -19,13 +19,14 @@ class DocumentSetup:
         self.vector_store = VectorStore()
         self.processed_files = []
     
-    def add_document(self, file_path: str, clear_existing: bool = False) -> bool:
+    def add_document(self, file_path: str, clear_existing: bool = False, source_name: str = None) -> bool:
         """
         Process and store a single document
         
         Args:
             file_path (str): Path to the document
             clear_existing (bool): Whether to clear existing documents first
+            source_name (str, optional): Name stored as the chunks' source (defaults to the file name)
             
         Returns:
             bool: Success status
@@ -76,7 +77,7 @@ class DocumentSetup:
             
             # Store chunks with metadata
             print("   💾 Storing in database...")
-            file_name = os.path.basename(file_path)
+            file_name = source_name or os.path.basename(file_path)
             
             # Add metadata to chunks
             chunk_ids = []
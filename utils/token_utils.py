@@ -2,13 +2,41 @@
 Token counting utility for prompts and responses
 """
 
+import functools
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+@functools.lru_cache(maxsize=8)
+def _get_enc(model_name: str):
+    """Load the tiktoken encoder for a model once and reuse it; None (also cached) if it can't be loaded"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except Exception:
+        # e.g. offline and the encoding isn't cached locally; don't retry the download on every call
+        return None
+
 def count_tokens(text: str, model_name: str = "gpt-3.5-turbo") -> int:
+    enc = _get_enc(model_name)
     try:
-        import tiktoken
-        enc = tiktoken.encoding_for_model(model_name)
         return len(enc.encode(text))
     except Exception:
-        # Fallback: use simple whitespace splitting
+        # Fallback (no encoder, or text it rejects): use simple whitespace splitting
         return len(text.split())
 
-# For output, you can also call this function with response text and model
\ No newline at end of file
+def truncate_to_tokens(text: str, max_tokens: int, model_name: str = "gpt-3.5-turbo") -> str:
+    """Keep only the trailing max_tokens tokens of text (used to bound conversation history)"""
+    if not text:
+        return text
+    enc = _get_enc(model_name)
+    if enc is None:
+        # Fallback: approximate four characters per token
+        return text[-max_tokens * 4:]
+    tokens = enc.encode(text)
+    return enc.decode(tokens[-max_tokens:]) if len(tokens) > max_tokens else text
+
+# For output, you can also call this function with response text and model
@@ -2,32 +2,71 @@
 Enhanced Flask Web API for Medical RAG System UI
 Modern UI with improved usability and visual design
 """
-import base64
+import atexit
+import logging
+import logging.handlers
 import os
-import time
-import traceback
-from pathlib import Path
-from io import BytesIO
+import queue
 import secrets
+import threading
 
-from flask import Flask, request, jsonify, render_template_string, send_from_directory, session
+from flask import Flask
 from flask_cors import CORS
-from openai import OpenAI
 
 # Import RAG components
 from core.rag_system import RAGSystem
 from scripts.setup_documents import DocumentSetup
-import processors.image_processor
-from config.settings import OPENAI_API_KEY, OPENAI_MODEL
-from web.routes import register_routes
+from web.routes import register_routes, UPLOAD_TEMP_DIR, UPLOAD_PARTS_DIR
+
+log = logging.getLogger("medbot.web")
+
+# Server-side sessions are optional; without them Flask keeps sessions in signed cookies
+try:
+    import redis
+    from flask_session import Session
+    SERVER_SESSIONS_AVAILABLE = True
+except ImportError:
+    SERVER_SESSIONS_AVAILABLE = False
+
+def _setup_logging():
+    """Send log records through a queue so request threads never block on handler I/O"""
+    root = logging.getLogger()
+    if root.handlers:
+        # Respect logging that was already configured by whatever is hosting the app
+        return
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+
+# Guards the one-time construction of the RAG system under threaded servers
+_init_lock = threading.Lock()
+
+# Directories the app expects to exist at runtime
+_REQUIRED_DIRS = ("data/documents", "data/chroma_db", "data/conversations", "logs")
 
 def create_app():
     """Create and configure Flask app"""
+    _setup_logging()
     app = Flask(__name__)
     CORS(app)
     
-    # Set up a secret key for sessions
-    app.secret_key = secrets.token_hex(16)
+    # Set up a secret key for sessions; a persistent key keeps sessions valid across restarts and workers
+    app.secret_key = os.environ.get("FLASK_SECRET_KEY")
+    if not app.secret_key:
+        log.warning("FLASK_SECRET_KEY not set. Using a random key; sessions will not survive restarts or span workers.")
+        app.secret_key = secrets.token_hex(16)
+    
+    # Keep sessions in Redis when configured so requests carry only a session id cookie
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        if SERVER_SESSIONS_AVAILABLE:
+            app.config.update(SESSION_TYPE="redis", SESSION_REDIS=redis.Redis.from_url(redis_url))
+            Session(app)
+        else:
+            log.warning("REDIS_URL is set but flask-session/redis are not installed. Using cookie sessions.")
     
     # Increase max content length to 16MB
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
@@ -39,20 +78,33 @@ def create_app():
     # Register routes
     register_routes(app)
     
-    # Create necessary directories
-    os.makedirs("data/documents", exist_ok=True)
-    os.makedirs("data/chroma_db", exist_ok=True)
-    os.makedirs("data/conversations", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    os.makedirs("temp_uploads", exist_ok=True)
+    # Create necessary directories (only once per process)
+    if not getattr(create_app, "_dirs_ready", False):
+        for d in _REQUIRED_DIRS:
+            if not os.path.isdir(d):
+                os.makedirs(d, exist_ok=True)
+        # Upload scratch space holds user files, so only the app's user may read it
+        for d in (UPLOAD_TEMP_DIR, UPLOAD_PARTS_DIR):
+            os.makedirs(d, mode=0o700, exist_ok=True)
+            os.chmod(d, 0o700)
+        create_app._dirs_ready = True
     
     return app
 
 def initialize_system(app):
     """Initialize RAG system lazily"""
-    if app.rag_system is None:
-        app.rag_system = RAGSystem()
-        app.document_setup = DocumentSetup()
+    if app.rag_system is not None:
+        return app.rag_system, app.document_setup
+    
+    with _init_lock:
+        if app.rag_system is None:
+            rag_system = RAGSystem()
+            document_setup = DocumentSetup()
+            # Load the image processing stack with the rest of the system instead of at import
+            import processors.image_processor  # noqa: F401
+            app.document_setup = document_setup
+            # Publish rag_system last so a non-None value implies document_setup is ready
+            app.rag_system = rag_system
     return app.rag_system, app.document_setup
 
 # Create app
@@ -66,4 +118,5 @@ if __name__ == '__main__':
     print("🛑 Press Ctrl+C to stop the server")
     print("=" * 50)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Handlers mostly wait on LLM and vector store calls, so serve them concurrently on threads
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
@@ -2,55 +2,348 @@
 API routes for the web application
 """
 
+import gzip
+import hashlib
+import logging
 import os
+import re
+import shutil
+import tempfile
+import threading
 import time
-import traceback
-import uuid
-from flask import request, jsonify, render_template_string, session
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from secrets import token_hex
+from flask import Response, request, jsonify, session, after_this_request
+from werkzeug.datastructures import FileStorage
 from processors.speech_handler import SpeechHandler
+from core.rag_system import MEDICAL_RE
+from utils.token_utils import truncate_to_tokens
+from config.settings import MAX_HISTORY_TOKENS, DATA_DIR
+from web.templates.index import (
+    HTML_TEMPLATE_MIN, HTML_TEMPLATE_ETAG, PRELOAD_LINK_HEADER, APP_JS, APP_JS_HASH
+)
 
-# Fix import to use the module
-import processors.image_processor
-from web.templates.index import HTML_TEMPLATE
+log = logging.getLogger("medbot.web")
+
+# orjson encodes straight to bytes and is much faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_response(obj):
+    """
+    Build a JSON response, using orjson when it is installed
+    
+    Args:
+        obj: JSON-serializable payload
+        
+    Returns:
+        Response: application/json response (pair with a status code as with jsonify)
+    """
+    if orjson is not None:
+        try:
+            return Response(orjson.dumps(obj), mimetype='application/json')
+        except TypeError:
+            # orjson is stricter about key and value types; let jsonify handle those
+            pass
+    return jsonify(obj)
+
+# Brotli is optional; static pages fall back to gzip-only precompression without it
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def _precompress(body):
+    """
+    Compress a static response body once, at startup
+    
+    Args:
+        body (bytes): Uncompressed body
+        
+    Returns:
+        dict: Content-Encoding -> compressed bytes, in order of preference
+    """
+    variants = {}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11, mode=brotli.MODE_TEXT)
+    variants["gzip"] = gzip.compress(body, 9)
+    return variants
+
+# One year; used for content-hashed URLs whose body can never change
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+def _static_response(body, variants, etag, mimetype, immutable=False):
+    """
+    Serve a precomputed body, picking a precompressed variant the client accepts
+    
+    Args:
+        body (bytes): Uncompressed body
+        variants (dict): Output of _precompress(body)
+        etag (str): ETag of the uncompressed body; encoded variants get a suffix
+        mimetype (str): Response mimetype
+        immutable (bool): Let any cache keep the response for a year without revalidating
+        
+    Returns:
+        Response: Response made conditional on If-None-Match
+    """
+    accepted = request.accept_encodings
+    for encoding, data in variants.items():
+        if accepted[encoding]:
+            response = Response(data, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f"{etag}-{encoding}")
+            break
+    else:
+        response = Response(body, mimetype=mimetype)
+        response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    if immutable:
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        # Always revalidate; not marked public because the page can carry the session cookie
+        response.cache_control.no_cache = True
+        response.cache_control.must_revalidate = True
+    return response.make_conditional(request)
+
+# Extensions (lowercase, without the dot) routed to the image pipeline / accepted for upload
+IMAGE_EXTS = frozenset({"png", "jpg", "jpeg", "bmp", "gif", "tiff"})
+DOC_EXTS = frozenset({"pdf", "txt", "docx", "md"})
+
+def _file_ext(filename):
+    """Return the lowercase extension of filename without the dot, or '' if it has none"""
+    # splitext, unlike a bare split on '.', gives no extension for names like "notes" or ".bashrc"
+    return os.path.splitext(filename)[1][1:].lower()
+
+# Uploads are copied to disk in fixed-size chunks instead of being sized up front
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+# Private directory for upload temp files; create_app makes it, readable only by the app's user.
+# A fixed path, so restarts and extra workers reuse it instead of each leaving a new one in /tmp.
+UPLOAD_TEMP_DIR = os.path.join(DATA_DIR, "upload_tmp")
+
+def _stream_to_disk(file, dst, max_bytes=MAX_UPLOAD_BYTES):
+    """
+    Copy an uploaded file (or a raw request body, via request.stream) into an open binary file chunk by chunk
+    
+    Returns:
+        int: Bytes written, or None if the upload exceeded max_bytes
+    """
+    written = 0
+    while True:
+        chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        written += len(chunk)
+        if written > max_bytes:
+            return None
+        dst.write(chunk)
+    return written
+
+# Files sent to /api/query in parts (POST /api/upload-chunk) are staged here until the query
+# arrives. It lives in the app's own data directory (create_app makes it, readable only by the
+# app's user) and is shared so any worker process can take any part.
+UPLOAD_PARTS_DIR = os.path.join(DATA_DIR, "upload_parts")
+MAX_UPLOAD_PARTS = 64
+MAX_UPLOAD_PART_BYTES = 8 * 1024 * 1024
+UPLOAD_PARTS_MAX_AGE = 60 * 60
+UPLOAD_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+def _purge_stale_upload_parts(now=None):
+    """Remove staged uploads that were never claimed by a query"""
+    now = now or time.time()
+    try:
+        entries = list(os.scandir(UPLOAD_PARTS_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime > UPLOAD_PARTS_MAX_AGE:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            pass
+
+def _assemble_upload(part_dir, parts, filename, max_bytes):
+    """
+    Join staged parts 0..parts-1 into one anonymous temp file and drop the parts
+    
+    Args:
+        part_dir (str): Directory holding the "<index>.part" files
+        parts (int): Number of parts the client sent
+        filename (str): Original file name, kept for extension checks and history
+        max_bytes (int): Largest allowed total size
+        
+    Returns:
+        FileStorage: The reassembled upload, or None if a part is missing or it is too large
+    """
+    paths = [os.path.join(part_dir, f"{i}.part") for i in range(parts)]
+    try:
+        if sum(os.path.getsize(path) for path in paths) > max_bytes:
+            return None
+    except OSError:
+        return None
+    
+    assembled = tempfile.TemporaryFile(dir=UPLOAD_TEMP_DIR)
+    for path in paths:
+        with open(path, "rb") as part:
+            shutil.copyfileobj(part, assembled, UPLOAD_CHUNK_SIZE)
+    assembled.seek(0)
+    shutil.rmtree(part_dir, ignore_errors=True)
+    return FileStorage(stream=assembled, filename=filename)
+
+# How long /api/status reuses its probe results; the UI polls this endpoint
+CONNECTION_STATUS_TTL = 5
+DATABASE_INFO_TTL = 30
+
+# Worker threads for running the independent /api/status probes side by side
+STATUS_PROBE_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="status-probe")
+
+# Synthesized TTS clips kept for repeat requests, bounded by count and total size
+TTS_CACHE_MAX_ENTRIES = 256
+TTS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+class _AudioCache:
+    """Thread-safe LRU cache of audio bytes keyed on (lang, text digest)"""
+    
+    def __init__(self, max_entries=TTS_CACHE_MAX_ENTRIES, max_bytes=TTS_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(text, lang):
+        return lang, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, key):
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+            return audio
+    
+    def put(self, key, audio):
+        if len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = audio
+            self._size += len(audio)
+            # Evict least recently used clips until both limits hold
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+tts_cache = _AudioCache()
+
+# How long browsers may reuse a clip fetched with GET /api/tts
+TTS_BROWSER_MAX_AGE = 24 * 60 * 60
 
 def register_routes(app):
     """Register all routes for the application"""
     
     # Initialize system function for all routes
     def init_system():
+        if app.rag_system is not None:
+            return app.rag_system, app.document_setup
         return app.initialize_system(app)
     
+    # Short-lived cache for status probes: key -> (timestamp, value). A refresh in progress is
+    # kept as a Future so concurrent requests wait on the same probe instead of each starting one.
+    status_cache = {}
+    status_refreshes = {}
+    status_lock = threading.Lock()
+    
+    def cached_probe(key, ttl, probe):
+        """Return a Future for the probe's value, reusing a fresh cached value or a running probe"""
+        with status_lock:
+            entry = status_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                future = Future()
+                future.set_result(entry[1])
+                return future
+            future = status_refreshes.get(key)
+            if future is not None:
+                return future
+            future = status_refreshes[key] = STATUS_PROBE_POOL.submit(probe)
+        # Outside the lock: the callback runs right here if the probe has already finished
+        future.add_done_callback(lambda done: store_probe(key, done))
+        return future
+    
+    def store_probe(key, future):
+        with status_lock:
+            # Not cached if it was invalidated while running, or if it failed
+            if status_refreshes.get(key) is not future:
+                return
+            del status_refreshes[key]
+            if future.exception() is None:
+                status_cache[key] = (time.monotonic(), future.result())
+    
+    def invalidate_probe(key):
+        with status_lock:
+            status_cache.pop(key, None)
+            status_refreshes.pop(key, None)
+    
+    # Parse the UI template once; it has no per-request variables, so the page is rendered once too
+    index_template = app.jinja_env.from_string(HTML_TEMPLATE_MIN)
+    index_html = index_template.render().encode("utf-8")
+    index_variants = _precompress(index_html)
+    
     @app.route('/')
     def index():
         """Serve the main UI"""
         # Initialize a session if none exists
         if 'session_id' not in session:
-            session['session_id'] = str(uuid.uuid4())
-        return render_template_string(HTML_TEMPLATE)
+            session['session_id'] = token_hex(16)
+        # Precompressed once at startup; browsers revalidate with If-None-Match and get a 304
+        response = _static_response(index_html, index_variants, HTML_TEMPLATE_ETAG, 'text/html')
+        response.headers['Link'] = PRELOAD_LINK_HEADER
+        return response
+
+    app_js_variants = _precompress(APP_JS)
+    
+    @app.route('/static/app.<version>.js')
+    def app_js(version):
+        """Serve the page script; only the current hash may be cached long-term"""
+        return _static_response(APP_JS, app_js_variants, APP_JS_HASH, 'text/javascript',
+                                immutable=(version == APP_JS_HASH))
 
     @app.route('/api/status')
     def get_status():
         """Get system status"""
         try:
             rag, setup = init_system()
-            info = setup.get_database_info()
+            session_id = session.get('session_id')
             
+            # The probes are independent, so run them concurrently
+            info_future = cached_probe("database_info", DATABASE_INFO_TTL, setup.get_database_info)
             # Test API connection
-            api_connected = rag.llm_client.test_connection()
+            api_future = cached_probe("api_connected", CONNECTION_STATUS_TTL, rag.llm_client.test_connection)
+            count_future = None
+            if session_id is not None:
+                count_future = STATUS_PROBE_POOL.submit(rag.get_message_count, session_id)
+            
+            info = info_future.result()
+            api_connected = api_future.result()
             
             # Get session info if available
             session_info = {}
-            if 'session_id' in session:
-                session_id = session['session_id']
-                # Get conversation history
-                history = rag.get_conversation_history(session_id)
-                messages_count = len(history.strip().split("\n\n")) if history else 0
+            if count_future is not None:
+                messages_count = count_future.result()
                 session_info = {
                     "id": session_id,
                     "messages_count": messages_count
                 }
             
-            return jsonify({
+            return json_response({
                 "document_count": info.get('document_count', 0),
                 "unique_documents": info.get('unique_documents', 0),
                 "sources": info.get('sources', []),
@@ -60,9 +353,8 @@ def register_routes(app):
                 "session": session_info
             })
         except Exception as e:
-            print(f"Status API error: {e}")
-            print(traceback.format_exc())
-            return jsonify({"error": str(e)}), 500
+            log.exception("Status API error")
+            return json_response({"error": str(e)}), 500
 
     @app.route('/api/query', methods=['POST'])
     def query_rag():
@@ -70,7 +362,7 @@ def register_routes(app):
         try:
             # Ensure we have a session
             if 'session_id' not in session:
-                session['session_id'] = str(uuid.uuid4())
+                session['session_id'] = token_hex(16)
                 
             session_id = session['session_id']
             
@@ -78,22 +370,39 @@ def register_routes(app):
             prompt_type = request.form.get('prompt_type', 'basic')
             file = request.files.get('file', None)
             
+            # Large files arrive beforehand through /api/upload-chunk and are referenced by id
+            upload_id = request.form.get('upload_id', '')
+            if not file and upload_id:
+                parts = request.form.get('upload_parts', 0, type=int)
+                if not UPLOAD_ID_RE.fullmatch(upload_id) or not 0 < parts <= MAX_UPLOAD_PARTS:
+                    return json_response({"error": "Invalid upload"}), 400
+                file = _assemble_upload(
+                    os.path.join(UPLOAD_PARTS_DIR, f"{session_id}_{upload_id}"), parts,
+                    request.form.get('filename', ''), app.config['MAX_CONTENT_LENGTH']
+                )
+                if file is None:
+                    return json_response({"error": "Upload incomplete or too large, please try again"}), 400
+                
+                @after_this_request
+                def close_upload(response):
+                    file.close()
+                    return response
+            
             # Special case: allow empty question if file is provided
             if not question and not file:
-                return jsonify({"error": "Question or file is required"}), 400
+                return json_response({"error": "Question or file is required"}), 400
             
             # Track timing
             start_time = time.time()
             
             # Check if file is empty
             if file and file.filename:
-                # Get file size
-                file.seek(0, os.SEEK_END)
-                file_size = file.tell()
-                file.seek(0)
+                # Peek a single byte rather than seeking to the end to size the upload
+                is_empty = not file.stream.read(1)
+                file.stream.seek(0)
                 
-                if file_size == 0:
-                    return jsonify({
+                if is_empty:
+                    return json_response({
                         "answer": "The uploaded file appears to be empty.",
                         "error": "Empty file",
                         "query_time": time.time() - start_time,
@@ -101,12 +410,16 @@ def register_routes(app):
                     }), 400
                 
                 # Check if it's an image file
-                ext = os.path.splitext(file.filename)[1].lower()
-                if ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff']:
+                if _file_ext(file.filename) in IMAGE_EXTS:
+                    # Imported here so the image stack isn't loaded at app import
+                    import processors.image_processor
+                    
                     # Process image directly using the module function with session
                     rag, _ = init_system()
-                    # Get conversation history
-                    conversation_history = rag.get_conversation_history(session_id)
+                    # Get conversation history, bounded to the most recent tokens
+                    conversation_history = truncate_to_tokens(
+                        rag.get_conversation_history(session_id), MAX_HISTORY_TOKENS
+                    )
                     
                     # Process the image
                     result = processors.image_processor.ImageProcessor.process_image(
@@ -114,23 +427,22 @@ def register_routes(app):
                     )
                     
                     # Ensure we have a valid response (never return "couldn't generate")
-                    answer = result.get("answer", "")
+                    answer = result.get("answer") or ""
                     if not answer or "couldn't generate a response" in answer.lower():
                         # Use fallback mechanism
                         answer = rag._ensure_valid_response(answer, question, prompt_type)
-                        result["answer"] = answer
                     
                     # Add to conversation history if successful
                     if 'error' not in result:
                         rag.add_to_conversation_history(
                             question if question else f"[Uploaded image: {file.filename}]",
-                            result.get("answer", ""),
+                            answer,
                             session_id
                         )
                         rag.save_conversation(session_id)
                     
-                    return jsonify({
-                        "answer": result.get("answer", "No answer generated"),
+                    return json_response({
+                        "answer": answer or "No answer generated",
                         "file_processed": True,
                         "query_time": time.time() - start_time,
                         "chunks_found": 0,
@@ -146,21 +458,17 @@ def register_routes(app):
                 session_id=session_id
             )
 
-            # Simple final quality check
-            if not result.get("answer") or len(result.get("answer", "").strip()) < 10:
-                print("Emergency fallback: Empty response detected in routes.py")
-                medical_keywords = ["health", "medicine", "doctor", "hospital", "disease", 
-                                   "condition", "symptom", "treatment", "drug", "patient", 
-                                   "nurse", "therapy", "medical", "clinical", "diagnosis", 
-                                   "surgery", "organ", "body", "anatomy", "nursing"]
-                
-                if any(keyword in question.lower() for keyword in medical_keywords):
-                    result["answer"] = "This appears to be a medical question. While I don't have specific information about this in my database, I'd recommend consulting with a healthcare professional for accurate information about this medical topic."
+            # Simple final quality check; read and strip the answer once
+            answer = (result.get("answer") or "").strip()
+            if len(answer) < 10:
+                log.warning("Emergency fallback: empty response detected")
+                if MEDICAL_RE.search(question) is not None:
+                    answer = "This appears to be a medical question. While I don't have specific information about this in my database, I'd recommend consulting with a healthcare professional for accurate information about this medical topic."
                 else:
-                    result["answer"] = "I am a medical bot and can only assist with medical-related topics."
+                    answer = "I am a medical bot and can only assist with medical-related topics."
             
-            return jsonify({
-                "answer": result.get("answer", "No answer generated"),
+            return json_response({
+                "answer": answer,
                 "chunks_found": result.get("chunks_found", 0),
                 "file_processed": result.get("file_processed", False),
                 "query_time": time.time() - start_time,
@@ -168,85 +476,115 @@ def register_routes(app):
             })
             
         except Exception as e:
-            print(f"Query API error: {e}")
-            print(traceback.format_exc())
+            log.exception("Query API error")
             
             # Try to generate a fallback response
             try:
                 rag, _ = init_system()
                 
-                # Define medical keywords here too for safety
-                medical_keywords = ["health", "medicine", "doctor", "hospital", "disease", "condition", 
-                                  "symptom", "treatment", "drug", "patient", "nurse", "therapy", "medical",
-                                  "clinical", "diagnosis", "surgery", "organ", "body", "anatomy", "nursing"]
-                
                 # Check if this is a medical question
-                is_medical_question = any(keyword in question.lower() for keyword in medical_keywords)
+                is_medical_question = MEDICAL_RE.search(question) is not None
                 
                 if is_medical_question:
                     fallback_answer = rag._ensure_valid_response("", question, prompt_type)
-                    return jsonify({
+                    return json_response({
                         "answer": fallback_answer if fallback_answer else f"Error processing query: {str(e)}",
                         "error": str(e),
                         "query_time": time.time() - start_time,
                         "chunks_found": 0
                     })
                 else:
-                    return jsonify({
+                    return json_response({
                         "answer": "I am a medical bot and can only assist with medical-related topics.",
                         "error": str(e),
                         "query_time": time.time() - start_time,
                         "chunks_found": 0
                     })
             except:
-                return jsonify({
+                return json_response({
                     "answer": f"Error processing query: {str(e)}",
                     "error": str(e),
                     "query_time": 0,
                     "chunks_found": 0
                 }), 500
 
+    @app.route('/api/upload-chunk', methods=['POST'])
+    def upload_chunk():
+        """Stage one part of a file that a following /api/query will reference by upload id"""
+        try:
+            # The page sets the session; parallel parts minting their own ids would split the upload
+            if 'session_id' not in session:
+                return json_response({"error": "No session, please reload the page"}), 400
+            
+            upload_id = request.headers.get('X-Upload-Id', '')
+            index = request.headers.get('X-Chunk-Index', -1, type=int)
+            total = request.headers.get('X-Total', 0, type=int)
+            if not UPLOAD_ID_RE.fullmatch(upload_id) or not 0 <= index < total <= MAX_UPLOAD_PARTS:
+                return json_response({"error": "Invalid chunk"}), 400
+            
+            # Uploads are namespaced by session so one client can't complete another's
+            part_dir = os.path.join(UPLOAD_PARTS_DIR, f"{session['session_id']}_{upload_id}")
+            if not os.path.isdir(part_dir):
+                _purge_stale_upload_parts()
+                os.makedirs(part_dir, exist_ok=True)
+            
+            # Written under a temporary name so a retried or interrupted part is never read half-done
+            fd, tmp_path = tempfile.mkstemp(dir=part_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as dst:
+                    written = _stream_to_disk(request, dst, MAX_UPLOAD_PART_BYTES)
+                if written is None:
+                    return json_response({"error": "Chunk too large"}), 413
+                os.replace(tmp_path, os.path.join(part_dir, f"{index}.part"))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            
+            return json_response({"received": index})
+            
+        except Exception as e:
+            log.exception("Chunk upload error")
+            return json_response({"error": str(e)}), 500
+    
     @app.route('/api/upload', methods=['POST'])
     def upload_document():
         """Upload and process a document"""
         try:
             if 'file' not in request.files:
-                return jsonify({"error": "No file provided"}), 400
+                return json_response({"error": "No file provided"}), 400
             
             file = request.files['file']
             if file.filename == '':
-                return jsonify({"error": "No file selected"}), 400
-            
-            # Check file size
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
-            
-            # 100MB limit
-            if file_size > 100 * 1024 * 1024:
-                return jsonify({"error": "File too large (max 100MB)"}), 400
+                return json_response({"error": "No file selected"}), 400
             
             # Get file extension
-            ext = os.path.splitext(file.filename)[1].lower()
+            ext = _file_ext(file.filename)
             
             # Check if extension is supported
-            supported_extensions = ['.pdf', '.txt', '.docx', '.md']
-            if ext not in supported_extensions:
-                return jsonify({"error": f"Unsupported file format: {ext}. Please use PDF, TXT, DOCX, or MD."}), 400
-            
-            # Save file temporarily
-            temp_dir = "temp_uploads"
-            os.makedirs(temp_dir, exist_ok=True)
-            temp_path = os.path.join(temp_dir, file.filename)
+            if ext not in DOC_EXTS:
+                shown_ext = f".{ext}" if ext else ""
+                return json_response({"error": f"Unsupported file format: {shown_ext}. Please use PDF, TXT, DOCX, or MD."}), 400
             
-            file.save(temp_path)
+            # Save under a generated name in our own temp dir; the client's filename never reaches the path
+            tmp = tempfile.NamedTemporaryFile(dir=UPLOAD_TEMP_DIR, suffix=f".{ext}", delete=False)
+            temp_path = tmp.name
             
             try:
-                # Process file
+                # Save in chunks, enforcing the 100MB limit as bytes arrive
+                with tmp:
+                    too_large = _stream_to_disk(file, tmp) is None
+                if too_large:
+                    return json_response({"error": "File too large (max 100MB)"}), 413
+                
+                # Process file, keeping the uploaded name as the document source
                 rag, setup = init_system()
-                result = setup.add_document(temp_path)
+                source_name = file.filename.replace("\\", "/").rpartition("/")[2]
+                result = setup.add_document(temp_path, source_name=source_name)
                 
-                return jsonify({
+                # The document list changed, so the next status poll must re-read it
+                invalidate_probe("database_info")
+                
+                return json_response({
                     "success": result.get("success", False),
                     "chunks_added": result.get("chunks_added", 0),
                     "file": file.filename,
@@ -255,16 +593,14 @@ def register_routes(app):
                 
             finally:
                 # Clean up temp file
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except:
-                        pass
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
             
         except Exception as e:
-            print(f"Upload error: {e}")
-            print(traceback.format_exc())
-            return jsonify({"error": str(e)}), 500
+            log.exception("Upload error")
+            return json_response({"error": str(e)}), 500
             
     @app.route('/api/clear-history', methods=['POST'])
     def clear_conversation_history():
@@ -276,47 +612,78 @@ def register_routes(app):
                 success = rag.delete_conversation(session_id)
                 
                 # Create a new session
-                session['session_id'] = str(uuid.uuid4())
+                session['session_id'] = token_hex(16)
                 
-                return jsonify({
+                return json_response({
                     "success": success,
                     "message": "Conversation history cleared",
                     "new_session_id": session['session_id']
                 })
             else:
-                return jsonify({
+                return json_response({
                     "success": False,
                     "error": "No active session"
                 }), 400
                 
         except Exception as e:
-            print(f"Clear history error: {e}")
-            return jsonify({"error": str(e)}), 500
+            log.exception("Clear history error")
+            return json_response({"error": str(e)}), 500
         
     # Add this endpoint within the register_routes function
-    @app.route('/api/tts', methods=['POST'])
+    @app.route('/api/tts', methods=['GET', 'POST'])
     def text_to_speech():
-        """Convert text to speech and return audio data"""
+        """
+        Convert text to speech and return the MP3 audio as the response body
+        
+        GET (?text=&lang=) streams the clip as it is synthesized so an <audio src> can start
+        playing after the first part; POST with a JSON body serves texts too long for a URL.
+        """
         try:
-            text = request.json.get('text', '')
-            lang = request.json.get('lang', 'en')
+            params = request.args if request.method == 'GET' else request.json
+            text = params.get('text', '')
+            lang = params.get('lang', 'en')
             
             if not text:
-                return jsonify({"error": "No text provided"}), 400
+                return json_response({"error": "No text provided"}), 400
             
             # Limit text length to prevent abuse
             if len(text) > 1000:
                 text = text[:1000] + "..."
             
-            # Convert text to speech
-            result = SpeechHandler.text_to_speech(text, lang)
-            
-            if result["success"]:
-                return jsonify(result)
+            # Identical (text, lang) pairs always produce the same clip, so reuse earlier syntheses
+            cache_key = tts_cache.key(text, lang)
+            audio = tts_cache.get(cache_key)
+            if audio is not None:
+                response = Response(audio, mimetype="audio/mpeg")
+                response = response.make_conditional(request, accept_ranges=True, complete_length=len(audio))
+            elif request.method == 'GET':
+                chunks = SpeechHandler.stream(text, lang)
+                # Pull the first part here so synthesis errors still become a JSON error response
+                first = next(chunks, b"")
+                
+                def generate():
+                    parts = [first]
+                    yield first
+                    for chunk in chunks:
+                        parts.append(chunk)
+                        yield chunk
+                    tts_cache.put(cache_key, b"".join(parts))
+                
+                response = Response(generate(), mimetype="audio/mpeg")
             else:
-                return jsonify({"error": result.get("error", "Unknown error")}), 500
+                # Send raw bytes rather than base64 inside JSON (a third smaller)
+                result = SpeechHandler.synthesize(text, lang)
+                if not result["success"]:
+                    return json_response({"error": result.get("error", "Unknown error")}), 500
+                tts_cache.put(cache_key, result["audio_bytes"])
+                response = Response(result["audio_bytes"], mimetype=result["audio_type"])
+            
+            if request.method == 'GET':
+                # The URL identifies the clip, so replays can come from the browser cache
+                response.cache_control.private = True
+                response.cache_control.max_age = TTS_BROWSER_MAX_AGE
+            return response
                 
         except Exception as e:
-            print(f"TTS API error: {e}")
-            print(traceback.format_exc())
-            return jsonify({"error": str(e)}), 500
\ No newline at end of file
+            log.exception("TTS API error")
+            return json_response({"error": str(e)}), 500
\ No newline at end of file
@@ -0,0 +1,981 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // DOM Elements
+    const sidebar = document.getElementById('sidebar');
+    const toggleSidebarBtn = document.getElementById('toggle-sidebar');
+    const messagesContainer = document.getElementById('messages-container');
+    const historySentinel = document.getElementById('history-sentinel');
+    const chatInput = document.getElementById('chat-input');
+    const sendBtn = document.getElementById('send-btn');
+    const sidebarFileInput = document.getElementById('sidebar-file-input');
+    const chatFileInput = document.getElementById('chat-file-input');
+    const sidebarFileDropZone = document.getElementById('sidebar-file-drop');
+    const uploadBtn = document.getElementById('upload-btn');
+    const uploadedFileContainer = document.getElementById('uploaded-file-container');
+    const responseTypeBtn = document.getElementById('response-type-btn');
+    const responseTypeDropdown = document.getElementById('response-type-dropdown');
+    const responseTypeOptions = responseTypeDropdown.querySelectorAll('.response-type-option');
+    const systemStatus = document.getElementById('system-status');
+    const documentList = document.getElementById('document-list');
+    const voiceBtn = document.getElementById('voice-btn');
+    const autoPlayBtn = document.getElementById('auto-play-btn');
+    const chatInputWrapper = document.querySelector('.chat-input-wrapper');
+    const userMessageTemplate = document.getElementById('tpl-user-message');
+    const messageFileTemplate = document.getElementById('tpl-message-file');
+    const botMessageTemplate = document.getElementById('tpl-bot-message');
+    const errorMessageTemplate = document.getElementById('tpl-error-message');
+    const typingIndicatorTemplate = document.getElementById('tpl-typing-indicator');
+    const documentItemTemplate = document.getElementById('tpl-document-item');
+    
+    // Status card fields, updated in place on each refresh
+    const connectionStatus = systemStatus.querySelector('.status-connection');
+    const documentCountStatus = systemStatus.querySelector('.status-documents');
+    const documentCount = document.createElement('strong');
+    const noDocumentsItem = cloneTemplate(documentItemTemplate);
+    setIcon(noDocumentsItem.querySelector('.icon'), 'fa-info-circle');
+    noDocumentsItem.querySelector('span').textContent = 'No documents loaded';
+    
+    
+    // State
+    let uploadedFile = null;
+    let uploadedFileSize = '';
+    // Blob URL behind an image attachment's thumbnail; it points at the File rather than copying it
+    let uploadedFilePreviewUrl = null;
+    let currentResponseType = 'medical';
+    let typingIndicator = null;
+    let isListening = false;
+    let recognition = null;
+    let autoPlayResponses = false;
+    
+    // Audio state: the clip that is playing or loading, and the play button that controls it
+    const audioState = { audio: null, button: null };
+    let currentVolume = 0.7;
+    
+    // In-flight requests; a newer request of the same kind cancels the older one
+    let queryAbort = null;
+    let statusAbort = null;
+    // Status is re-read when the tab comes back into view if it is older than this
+    const STATUS_STALE_MS = 30 * 1000;
+    let statusFetchedAt = 0;
+    // Sources the document list was last built from; unchanged lists are not rebuilt
+    let documentListKey = null;
+    
+    // One-shot and typing animations run through the Web Animations API
+    const reduceMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+    const FADE_IN_UP = [
+        { opacity: 0, transform: 'translate3d(0, 10px, 0)' },
+        { opacity: 1, transform: 'translate3d(0, 0, 0)' }
+    ];
+    const TYPING_BOUNCE = [
+        { opacity: 0.5, transform: 'translate3d(0, 0, 0)' },
+        { opacity: 1, transform: 'translate3d(0, -5px, 0)' },
+        { opacity: 0.5, transform: 'translate3d(0, 0, 0)' }
+    ];
+    
+    // Markdown: rendered once per reply text (LRU), with raw HTML shown as text
+    const MARKDOWN_CACHE_SIZE = 64;
+    const markdownCache = new Map();
+    const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+    const UNSAFE_URL = /^\s*(javascript|vbscript|data):/i;
+    if (window.marked) {
+        marked.use({
+            renderer: {
+                // marked >= 13 passes a token, older releases the raw HTML string
+                html(token) {
+                    return escapeHtml(typeof token === 'string' ? token : token.text);
+                }
+            }
+        });
+    }
+    
+    // Files of at least CHUNKED_UPLOAD_MIN are sent ahead of the query in parts, a few at a time
+    const CHUNKED_UPLOAD_MIN = 1024 * 1024;
+    const UPLOAD_PART_SIZE = 4 * 1024 * 1024;
+    const UPLOAD_CONCURRENCY = 4;
+    const UPLOAD_PART_ATTEMPTS = 3;
+    // Upload id and finished parts per file, so resending after a failure only sends what's missing
+    const partialUploads = new WeakMap();
+    
+    // Only the newest messages stay in the DOM; older ones are parked here (oldest first)
+    // and restored in batches when the user scrolls up to them. Past the parking limit the
+    // oldest messages are dropped for good.
+    const MAX_LIVE_MESSAGES = 50;
+    const MAX_TRIMMED_MESSAGES = 200;
+    const RESTORE_BATCH_SIZE = 20;
+    // Further from the bottom than this, the user is reading history and nothing is trimmed
+    const READING_HISTORY_PX = 200;
+    const liveMessages = [];
+    const trimmedMessages = [];
+    const scrollAnchoring = window.CSS && CSS.supports('overflow-anchor', 'auto');
+    
+    // Text each play button speaks, kept off the DOM instead of in an encoded data attribute
+    const playButtonTexts = new WeakMap();
+    
+    // Initialize
+    if (window.IntersectionObserver) {
+        new IntersectionObserver(entries => {
+            if (entries[0].isIntersecting) {
+                restoreTrimmedMessages();
+            }
+        }, { root: messagesContainer, rootMargin: '200px 0px 0px 0px' }).observe(historySentinel);
+    }
+    fetchSystemStatus();
+    adjustTextareaHeight();
+    
+    // Nothing is fetched while the tab is hidden; catch up when it is shown again
+    document.addEventListener('visibilitychange', function() {
+        if (!document.hidden && Date.now() - statusFetchedAt > STATUS_STALE_MS) {
+            fetchSystemStatus();
+        }
+    });
+    
+    // Event Listeners
+    toggleSidebarBtn.addEventListener('click', toggleSidebar);
+    
+    chatInput.addEventListener('input', function() {
+        updateSendButtonState();
+        scheduleTextareaResize();
+    });
+    
+    chatInput.addEventListener('keydown', function(e) {
+        if (e.key === 'Enter' && !e.shiftKey) {
+            e.preventDefault();
+            if (!sendBtn.disabled) {
+                handleSendMessage();
+            }
+        }
+    });
+    
+    sendBtn.addEventListener('click', handleSendMessage);
+    
+    // File upload event listeners - Sidebar
+    sidebarFileDropZone.addEventListener('click', () => sidebarFileInput.click());
+    sidebarFileDropZone.addEventListener('dragover', handleDragOver);
+    sidebarFileDropZone.addEventListener('dragleave', handleDragLeave, { passive: true });
+    sidebarFileDropZone.addEventListener('drop', handleFileDrop);
+    sidebarFileInput.addEventListener('change', function() {
+        if (this.files.length) {
+            handleFile(this.files[0], 'sidebar');
+        }
+    });
+    
+    // File upload event listeners - Chat
+    uploadBtn.addEventListener('click', () => chatFileInput.click());
+    chatFileInput.addEventListener('change', function() {
+        if (this.files.length) {
+            handleFile(this.files[0], 'chat');
+        }
+    });
+    
+    // Response type dropdown
+    responseTypeBtn.addEventListener('click', toggleResponseTypeDropdown);
+    responseTypeDropdown.addEventListener('click', handleResponseTypeSelection);
+    // Any press outside closes it; nothing else is checked while it is closed
+    document.addEventListener('pointerdown', function(e) {
+        if (responseTypeDropdown.style.display !== 'block') return;
+        if (!responseTypeBtn.contains(e.target) && !responseTypeDropdown.contains(e.target)) {
+            responseTypeDropdown.style.display = 'none';
+        }
+    }, { capture: true, passive: true });
+    
+    // Per-message audio controls, delegated so bot replies don't each get their own listeners
+    messagesContainer.addEventListener('click', function(e) {
+        const playBtn = e.target.closest('.play-voice-btn');
+        if (playBtn && !playBtn.disabled) {
+            togglePlayVoice(playButtonTexts.get(playBtn), playBtn);
+        }
+    });
+    messagesContainer.addEventListener('input', function(e) {
+        if (e.target.classList.contains('volume-slider')) {
+            handleVolumeInput(e.target);
+        }
+    });
+    
+    // Voice functionality
+    if (voiceBtn) {
+        voiceBtn.addEventListener('click', toggleSpeechRecognition);
+    }
+    
+    if (autoPlayBtn) {
+        autoPlayBtn.addEventListener('click', toggleAutoPlayResponses);
+    }
+    
+    // Functions
+    function toggleSidebar() {
+        // The collapsed layout is pure CSS, keyed off this one class
+        sidebar.classList.toggle('sidebar-collapsed');
+    }
+    
+    function updateSendButtonState() {
+        sendBtn.disabled = !chatInput.value.trim() && !uploadedFile;
+    }
+    
+    function adjustTextareaHeight() {
+        chatInput.style.height = 'auto';
+        chatInput.style.height = Math.min(chatInput.scrollHeight, 100) + 'px';
+    }
+    
+    // Resizing forces a layout, so keystrokes and pastes within one frame share a single resize
+    let textareaResizePending = false;
+    function scheduleTextareaResize() {
+        if (textareaResizePending) return;
+        textareaResizePending = true;
+        requestAnimationFrame(() => {
+            textareaResizePending = false;
+            adjustTextareaHeight();
+        });
+    }
+    
+    function animate(element, keyframes, options) {
+        if (element && element.animate && !reduceMotion.matches) {
+            element.animate(keyframes, options);
+        }
+    }
+    
+    function toggleResponseTypeDropdown(e) {
+        e.stopPropagation();
+        const opening = responseTypeDropdown.style.display !== 'block';
+        responseTypeDropdown.style.display = opening ? 'block' : 'none';
+        if (opening) {
+            animate(responseTypeDropdown, FADE_IN_UP, { duration: 200, easing: 'ease-out' });
+        }
+    }
+    
+    function handleResponseTypeSelection(e) {
+        const option = e.target.closest('.response-type-option');
+        if (option) {
+            currentResponseType = option.dataset.type;
+            responseTypeOptions.forEach(opt => {
+                opt.classList.remove('selected');
+            });
+            option.classList.add('selected');
+            responseTypeDropdown.style.display = 'none';
+        }
+    }
+    
+    function handleDragOver(e) {
+        e.preventDefault();
+        // dragover repeats while a file hovers; only the first one changes anything
+        if (!this.classList.contains('dragging')) {
+            this.classList.add('dragging');
+        }
+    }
+    
+    function handleDragLeave() {
+        this.classList.remove('dragging');
+    }
+    
+    function handleFileDrop(e) {
+        e.preventDefault();
+        this.classList.remove('dragging');
+        
+        if (e.dataTransfer.files.length) {
+            handleFile(e.dataTransfer.files[0], 'sidebar');
+        }
+    }
+    
+    function handleFile(file, source) {
+        // Check file type
+        const validTypes = ['application/pdf', 'image/png', 'image/jpeg', 'image/gif', 'image/bmp'];
+        if (!validTypes.includes(file.type)) {
+            alert('Please upload a PDF or image file (PNG, JPG, GIF, BMP)');
+            return;
+        }
+        
+        // Check file size (max 10MB)
+        if (file.size > 10 * 1024 * 1024) {
+            alert('File size exceeds 10MB limit');
+            return;
+        }
+        
+        // Set uploaded file and update UI
+        URL.revokeObjectURL(uploadedFilePreviewUrl);
+        uploadedFilePreviewUrl = null;
+        uploadedFile = file;
+        uploadedFileSize = formatFileSize(file.size);
+        updateSendButtonState();
+        
+        // Update the upload button to show there's a file attached
+        uploadBtn.classList.add('active');
+        chatInputWrapper.classList.add('upload-active');
+        
+        // Display file preview; images show a thumbnail of the file itself
+        let fileIcon = '<svg class="icon"><use href="#fa-file-pdf"></use></svg>';
+        if (file.type.startsWith('image/')) {
+            uploadedFilePreviewUrl = URL.createObjectURL(file);
+            fileIcon = `<img class="uploaded-file-thumb" src="${uploadedFilePreviewUrl}" alt="" decoding="async">`;
+        }
+        
+        // Always show the file in the chat input area regardless of where it was uploaded from
+        uploadedFileContainer.innerHTML = `
+            <div class="uploaded-file">
+                ${fileIcon}
+                <div>
+                    <span class="uploaded-file-name">${escapeHtml(file.name)}</span>
+                    <span class="uploaded-file-size">${uploadedFileSize}</span>
+                </div>
+                <button class="uploaded-file-remove">
+                    <svg class="icon"><use href="#fa-times"></use></svg>
+                </button>
+            </div>
+        `;
+        const preview = uploadedFileContainer.firstElementChild;
+        animate(preview, FADE_IN_UP, { duration: 300, easing: 'ease-out' });
+        
+        // Add remove event listener
+        preview.querySelector('.uploaded-file-remove').addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+            clearFileUpload();
+        });
+    }
+    
+    function clearFileUpload() {
+        uploadedFile = null;
+        uploadedFileSize = '';
+        URL.revokeObjectURL(uploadedFilePreviewUrl);
+        uploadedFilePreviewUrl = null;
+        uploadedFileContainer.innerHTML = '';
+        uploadBtn.classList.remove('active');
+        chatInputWrapper.classList.remove('upload-active');
+        sidebarFileInput.value = '';
+        chatFileInput.value = '';
+        updateSendButtonState();
+    }
+    
+    function handleSendMessage() {
+        const question = chatInput.value.trim();
+        
+        // If no question and no file, do nothing
+        if (!question && !uploadedFile) return;
+        
+        // Add user message to chat
+        addUserMessage(question || 'Analyze this file');
+        
+        // Clear input and reset
+        chatInput.value = '';
+        adjustTextareaHeight();
+        
+        // Show typing indicator
+        showTypingIndicator();
+        
+        // Large files go up first in parts; the query then refers to them by id
+        const file = uploadedFile;
+        const staging = file && file.size >= CHUNKED_UPLOAD_MIN ? uploadChunked(file) : Promise.resolve(null);
+        
+        // Only the latest question's answer is shown; an earlier one still pending is dropped
+        if (queryAbort) {
+            queryAbort.abort();
+        }
+        const abort = queryAbort = new AbortController();
+        
+        staging
+        .then(staged => {
+            // Prepare form data
+            const formData = new FormData();
+            formData.append('question', question);
+            formData.append('prompt_type', currentResponseType);
+            
+            if (staged) {
+                formData.append('upload_id', staged.uploadId);
+                formData.append('upload_parts', staged.parts);
+                formData.append('filename', file.name);
+            } else if (file) {
+                formData.append('file', file);
+            }
+            
+            // Send API request
+            return fetch('/api/query', {
+                method: 'POST',
+                body: formData,
+                signal: abort.signal
+            });
+        })
+        .then(response => response.json())
+        .then(result => {
+            // Remove typing indicator
+            hideTypingIndicator();
+            
+            if (result.error) {
+                addBotErrorMessage(result.error);
+            } else {
+                addBotMessage(result.answer, result);
+            }
+            
+            // Clear file upload after sending
+            clearFileUpload();
+            updateSendButtonState();
+        })
+        .catch(error => {
+            // Superseded by a newer question, which owns the typing indicator now
+            if (abort.signal.aborted) return;
+            hideTypingIndicator();
+            addBotErrorMessage('Network error. Please try again.');
+            console.error('Error:', error);
+        })
+        .finally(() => {
+            if (queryAbort === abort) {
+                queryAbort = null;
+            }
+        });
+        
+        // Scroll to bottom
+        scrollToBottom();
+    }
+    
+    function newUploadId() {
+        const bytes = crypto.getRandomValues(new Uint8Array(16));
+        return Array.from(bytes, b => b.toString(16).padStart(2, '0')).join('');
+    }
+    
+    async function uploadChunked(file) {
+        if (!partialUploads.has(file)) {
+            partialUploads.set(file, { uploadId: newUploadId(), sent: new Set() });
+        }
+        const { uploadId, sent } = partialUploads.get(file);
+        const parts = Math.ceil(file.size / UPLOAD_PART_SIZE);
+        const pending = [];
+        for (let i = 0; i < parts; i++) {
+            if (!sent.has(i)) pending.push(i);
+        }
+        
+        async function sendPart(index) {
+            const body = file.slice(index * UPLOAD_PART_SIZE, (index + 1) * UPLOAD_PART_SIZE);
+            for (let attempt = 1; ; attempt++) {
+                const response = await fetch('/api/upload-chunk', {
+                    method: 'POST',
+                    headers: {
+                        'X-Upload-Id': uploadId,
+                        'X-Chunk-Index': String(index),
+                        'X-Total': String(parts)
+                    },
+                    body: body
+                }).catch(() => null);
+                if (response && response.ok) {
+                    sent.add(index);
+                    return;
+                }
+                
+                // Network failures and server errors are retried; a rejected part would just be rejected again
+                if ((response && response.status < 500) || attempt === UPLOAD_PART_ATTEMPTS) {
+                    throw new Error(`Uploading part ${index + 1} of ${parts} failed`);
+                }
+            }
+        }
+        
+        async function sendParts() {
+            while (pending.length) {
+                await sendPart(pending.shift());
+            }
+        }
+        
+        await Promise.all(Array.from({ length: Math.min(UPLOAD_CONCURRENCY, pending.length) }, sendParts));
+        // The server consumes the parts with the query, so a later send of this file starts over
+        partialUploads.delete(file);
+        return { uploadId: uploadId, parts: parts };
+    }
+    
+    function addUserMessage(text) {
+        const message = cloneTemplate(userMessageTemplate);
+        message.querySelector('.message-text').textContent = text;
+        message.querySelector('.message-time').textContent = formatTime(new Date());
+        
+        // Add file info if it's a file upload
+        if (uploadedFile) {
+            const fileInfo = cloneTemplate(messageFileTemplate);
+            if (uploadedFile.type.startsWith('image/')) {
+                setIcon(fileInfo.querySelector('.icon'), 'fa-file-image');
+            }
+            fileInfo.querySelector('.message-file-name').textContent =
+                `${uploadedFile.name} (${uploadedFileSize})`;
+            message.querySelector('.message-time').before(fileInfo);
+        }
+        
+        appendMessage(message);
+        scrollToBottom();
+    }
+    
+    function addBotMessage(text, data) {
+        // Clicks and volume changes are handled by the delegated listeners on messagesContainer
+        const message = cloneTemplate(botMessageTemplate);
+        message.querySelector('.message-text').innerHTML = renderMarkdown(text);
+        message.querySelector('.message-chunks').textContent = `${data.chunks_found || 0} chunks found`;
+        message.querySelector('.message-query-time').textContent =
+            data.query_time ? data.query_time.toFixed(2) + 's' : 'N/A';
+        message.querySelector('.volume-slider').value = currentVolume;
+        updateVolumeIcon(message.querySelector('.volume-icon'), currentVolume);
+        message.querySelector('.message-time').textContent = formatTime(new Date());
+        
+        const playBtn = message.querySelector('.play-voice-btn');
+        playButtonTexts.set(playBtn, text);
+        
+        appendMessage(message);
+        scrollToBottom();
+        
+        // Auto-play if enabled
+        if (autoPlayResponses) {
+            togglePlayVoice(text, playBtn);
+        }
+    }
+    
+    function escapeHtml(text) {
+        return text.replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+    }
+    
+    function renderMarkdown(text) {
+        let html = markdownCache.get(text);
+        if (html === undefined) {
+            html = window.marked ? stripUnsafeUrls(marked.parse(text)) : escapeHtml(text);
+        } else {
+            // Re-inserted below to mark it most recently used
+            markdownCache.delete(text);
+        }
+        markdownCache.set(text, html);
+        if (markdownCache.size > MARKDOWN_CACHE_SIZE) {
+            markdownCache.delete(markdownCache.keys().next().value);
+        }
+        return html;
+    }
+    
+    function stripUnsafeUrls(html) {
+        // Template content is inert, so nothing loads or runs while links are checked
+        const tpl = document.createElement('template');
+        tpl.innerHTML = html;
+        tpl.content.querySelectorAll('[href], [src]').forEach(el => {
+            ['href', 'src'].forEach(name => {
+                if (UNSAFE_URL.test(el.getAttribute(name) || '')) {
+                    el.removeAttribute(name);
+                }
+            });
+        });
+        return tpl.innerHTML;
+    }
+    
+    function volumeIconHref(volume) {
+        if (volume === 0) {
+            return '#fa-volume-mute';
+        }
+        return volume < 0.5 ? '#fa-volume-down' : '#fa-volume-up';
+    }
+    
+    function updateVolumeIcon(iconElement, volume) {
+        if (!iconElement) return;
+        iconElement.firstElementChild.setAttribute('href', volumeIconHref(volume));
+    }
+    
+    function appendMessage(message) {
+        // Measured before the new message changes the height
+        const readingHistory = messagesContainer.scrollHeight - messagesContainer.scrollTop -
+            messagesContainer.clientHeight > READING_HISTORY_PX;
+        messagesContainer.appendChild(message);
+        liveMessages.push(message);
+        
+        // Without the observer there is no way to bring messages back, so keep them all.
+        // Restored history the user is looking at stays; a later append trims it instead.
+        if (!window.IntersectionObserver || readingHistory) return;
+        while (liveMessages.length > MAX_LIVE_MESSAGES) {
+            const oldest = liveMessages.shift();
+            oldest.remove();
+            trimmedMessages.push(oldest);
+        }
+        if (trimmedMessages.length > MAX_TRIMMED_MESSAGES) {
+            trimmedMessages.splice(0, trimmedMessages.length - MAX_TRIMMED_MESSAGES);
+        }
+    }
+    
+    function restoreTrimmedMessages() {
+        if (!trimmedMessages.length) return;
+        
+        const batch = trimmedMessages.splice(-RESTORE_BATCH_SIZE);
+        const fragment = document.createDocumentFragment();
+        batch.forEach(message => fragment.appendChild(message));
+        
+        const previousHeight = messagesContainer.scrollHeight;
+        historySentinel.after(fragment);
+        liveMessages.unshift(...batch);
+        // Browsers with scroll anchoring keep the view in place themselves
+        if (!scrollAnchoring) {
+            messagesContainer.scrollTop += messagesContainer.scrollHeight - previousHeight;
+        }
+    }
+    
+    function cloneTemplate(template) {
+        return template.content.firstElementChild.cloneNode(true);
+    }
+    
+    function setIcon(iconElement, name) {
+        iconElement.firstElementChild.setAttribute('href', '#' + name);
+    }
+    
+    function handleVolumeInput(slider) {
+        currentVolume = parseFloat(slider.value);
+        updateVolumeIcon(slider.previousElementSibling, currentVolume);
+        
+        // Update current audio if playing
+        if (audioState.audio) {
+            audioState.audio.volume = currentVolume;
+        }
+    }
+    
+    // Longer URLs would exceed common request-line limits (gunicorn's is 4094 bytes)
+    const TTS_MAX_URL_LENGTH = 4000;
+    
+    function loadTtsAudio(text) {
+        // Stream through GET so playback starts with the first synthesized part
+        const url = '/api/tts?lang=en&text=' + encodeURIComponent(text);
+        if (url.length <= TTS_MAX_URL_LENGTH) {
+            const audio = new Audio(url);
+            audio.preload = 'auto';
+            return Promise.resolve(audio);
+        }
+        
+        // Too long for a URL: POST it and play the downloaded clip
+        return fetch('/api/tts', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                text: text,
+                lang: 'en'
+            })
+        })
+        .then(response => {
+            // Audio comes back as the raw response body; errors are still JSON
+            if (!response.ok) {
+                return response.json().then(data => { throw new Error(data.error); });
+            }
+            return response.blob();
+        })
+        .then(blob => new Audio(URL.createObjectURL(blob)));
+    }
+    
+    // Clips stay loaded per play button so replaying a message doesn't fetch and decode it again
+    const AUDIO_CACHE_SIZE = 8;
+    const audioCache = new Map();
+    
+    function getTtsAudio(text, button) {
+        const cached = audioCache.get(button);
+        if (cached) {
+            // Move to the newest end and rewind
+            audioCache.delete(button);
+            audioCache.set(button, cached);
+            cached.currentTime = 0;
+            return Promise.resolve(cached);
+        }
+        
+        return loadTtsAudio(text).then(audio => {
+            audioCache.set(button, audio);
+            if (audioCache.size > AUDIO_CACHE_SIZE) {
+                const [oldestButton, oldestAudio] = audioCache.entries().next().value;
+                audioCache.delete(oldestButton);
+                URL.revokeObjectURL(oldestAudio.src);
+            }
+            return audio;
+        });
+    }
+    
+    function resetPlayButton(buttonElement) {
+        buttonElement.innerHTML = '<svg class="icon"><use href="#fa-play"></use></svg>';
+        buttonElement.disabled = false;
+        buttonElement.classList.remove('playing');
+    }
+    
+    function stopAudio() {
+        // The clip stays cached for a replay
+        if (audioState.audio) {
+            audioState.audio.pause();
+        }
+        if (audioState.button) {
+            resetPlayButton(audioState.button);
+        }
+        audioState.audio = null;
+        audioState.button = null;
+    }
+    
+    function togglePlayVoice(text, buttonElement) {
+        if (!text) return;
+        
+        // The loaded clip pauses and resumes in place
+        const loaded = audioState.audio;
+        if (buttonElement === audioState.button && loaded) {
+            if (loaded.paused) {
+                loaded.play();
+                buttonElement.innerHTML = '<svg class="icon"><use href="#fa-pause"></use></svg>';
+                buttonElement.classList.add('playing');
+            } else {
+                loaded.pause();
+                buttonElement.innerHTML = '<svg class="icon"><use href="#fa-play"></use></svg>';
+                buttonElement.classList.remove('playing');
+            }
+            return;
+        }
+        
+        // Any other button stops whatever was playing or loading and starts its own clip
+        stopAudio();
+        
+        // Show loading indicator
+        buttonElement.innerHTML = '<svg class="icon icon-spin"><use href="#fa-spinner"></use></svg>';
+        buttonElement.disabled = true;
+        audioState.button = buttonElement;
+        
+        getTtsAudio(text, buttonElement)
+        .then(audio => {
+            // Another clip was started while this one loaded
+            if (audioState.button !== buttonElement) return;
+            
+            audio.volume = currentVolume;
+            audioState.audio = audio;
+            audio.onended = function() {
+                if (audio === audioState.audio) {
+                    stopAudio();
+                }
+            };
+            
+            // Resolves once playback has actually started
+            return audio.play().then(() => {
+                if (audio !== audioState.audio) return;
+                buttonElement.innerHTML = '<svg class="icon"><use href="#fa-pause"></use></svg>';
+                buttonElement.disabled = false;
+                buttonElement.classList.add('playing');
+            });
+        })
+        .catch(error => {
+            // Stopped before playback started; the clip itself is fine
+            if (error.name === 'AbortError') return;
+            
+            console.error('TTS Error:', error);
+            audioCache.delete(buttonElement);
+            if (buttonElement === audioState.button) {
+                audioState.audio = null;
+                audioState.button = null;
+            }
+            resetPlayButton(buttonElement);
+        });
+    }
+    
+    function addBotErrorMessage(text) {
+        const message = cloneTemplate(errorMessageTemplate);
+        message.querySelector('.error-text').textContent = text;
+        message.querySelector('.message-time').textContent = formatTime(new Date());
+        
+        appendMessage(message);
+        scrollToBottom();
+    }
+    
+    function showTypingIndicator() {
+        if (typingIndicator) return;
+        
+        typingIndicator = cloneTemplate(typingIndicatorTemplate);
+        typingIndicator.querySelectorAll('.typing-dot').forEach((dot, i) => {
+            animate(dot, TYPING_BOUNCE, { duration: 1400, iterations: Infinity, delay: i * 200, easing: 'ease-in-out' });
+        });
+        messagesContainer.appendChild(typingIndicator);
+        scrollToBottom();
+    }
+    
+    function hideTypingIndicator() {
+        if (typingIndicator) {
+            typingIndicator.remove();
+            typingIndicator = null;
+        }
+    }
+    
+    // Appends in the same frame (user message, typing indicator, reply) share one scroll
+    let scrollPending = false;
+    function scrollToBottom() {
+        if (scrollPending) return;
+        scrollPending = true;
+        requestAnimationFrame(() => {
+            scrollPending = false;
+            const distance = messagesContainer.scrollHeight - messagesContainer.scrollTop - messagesContainer.clientHeight;
+            if (distance > 4) {
+                messagesContainer.scrollTop = messagesContainer.scrollHeight;
+            }
+        });
+    }
+    
+    // Built once; formats as HH:MM in the local time zone
+    const timeFormat = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit', hourCycle: 'h23' });
+    
+    function formatTime(date) {
+        return timeFormat.format(date);
+    }
+    
+    function formatFileSize(bytes) {
+        if (bytes < 1024) return bytes + ' bytes';
+        else if (bytes < 1048576) return (bytes / 1024).toFixed(1) + ' KB';
+        else return (bytes / 1048576).toFixed(1) + ' MB';
+    }
+    
+    function setConnectionStatus(iconName, label, online) {
+        setIcon(connectionStatus.querySelector('.icon'), iconName);
+        connectionStatus.querySelector('.status-label').textContent = label;
+        
+        const badge = connectionStatus.querySelector('.status-badge');
+        badge.className = online ? 'status-badge success' : 'status-badge danger';
+        setIcon(badge.querySelector('.icon'), online ? 'fa-plug' : 'fa-times');
+        badge.querySelector('.status-badge-text').textContent = online ? 'Online' : 'Offline';
+        badge.hidden = false;
+    }
+    
+    async function fetchSystemStatus() {
+        if (statusAbort) {
+            statusAbort.abort();
+        }
+        const abort = statusAbort = new AbortController();
+        statusFetchedAt = Date.now();
+        
+        try {
+            const response = await fetch('/api/status', { signal: abort.signal });
+            const data = await response.json();
+            
+            // Update system status
+            if (data.api_connected) {
+                setConnectionStatus('fa-check-circle', 'API Connected', true);
+            } else {
+                setConnectionStatus('fa-exclamation-circle', 'API Not Connected', false);
+            }
+            documentCount.textContent = data.document_count || 0;
+            documentCountStatus.querySelector('.status-label').replaceChildren('Documents: ', documentCount);
+            documentCountStatus.hidden = false;
+            
+            // Update document list in one go
+            const sources = data.sources || [];
+            const sourcesKey = sources.join('\n');
+            if (sourcesKey !== documentListKey) {
+                documentListKey = sourcesKey;
+                if (sources.length) {
+                    const docList = document.createDocumentFragment();
+                    sources.forEach(source => {
+                        const item = cloneTemplate(documentItemTemplate);
+                        item.querySelector('span').textContent = source;
+                        docList.appendChild(item);
+                    });
+                    documentList.replaceChildren(docList);
+                } else {
+                    documentList.replaceChildren(noDocumentsItem);
+                }
+            }
+            
+        } catch (error) {
+            if (abort.signal.aborted) return;
+            console.error('Error fetching system status:', error);
+            setConnectionStatus('fa-exclamation-triangle', 'Connection Error', false);
+            documentCountStatus.hidden = true;
+        }
+    }
+    
+    // Speech recognition setup; runs on the first click of the voice button
+    function setupSpeechRecognition() {
+        // Check if browser supports speech recognition
+        if ('SpeechRecognition' in window || 'webkitSpeechRecognition' in window) {
+            const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+            recognition = new SpeechRecognition();
+            recognition.continuous = false;
+            recognition.interimResults = true;
+            recognition.lang = 'en-US';
+            
+            recognition.onstart = function() {
+                isListening = true;
+                voiceBtn.classList.add('listening');
+                voiceBtn.innerHTML = '<svg class="icon"><use href="#fa-microphone-alt"></use></svg>';
+                console.log('Speech recognition started');
+            };
+            
+            recognition.onresult = function(event) {
+                const interimParts = [];
+                const finalParts = [];
+                
+                for (let i = event.resultIndex; i < event.results.length; i++) {
+                    const result = event.results[i];
+                    (result.isFinal ? finalParts : interimParts).push(result[0].transcript);
+                }
+                
+                // Update chat input with transcript
+                if (finalParts.length) {
+                    scheduleTranscriptWrite(finalParts.join(''), true);
+                } else if (interimParts.length) {
+                    scheduleTranscriptWrite(interimParts.join(''), false);
+                }
+            };
+            
+            recognition.onerror = function(event) {
+                isListening = false;
+                voiceBtn.classList.remove('listening');
+                voiceBtn.innerHTML = '<svg class="icon"><use href="#fa-microphone"></use></svg>';
+                console.error('Speech recognition error', event.error);
+                
+                if (event.error === 'not-allowed') {
+                    // Show a message to the user about microphone permission
+                    addBotErrorMessage('Microphone access denied. Please allow microphone access to use voice input.');
+                }
+            };
+            
+            recognition.onend = function() {
+                isListening = false;
+                voiceBtn.classList.remove('listening');
+                voiceBtn.innerHTML = '<svg class="icon"><use href="#fa-microphone"></use></svg>';
+                console.log('Speech recognition ended');
+            };
+            
+            return true;
+        } else {
+            console.error('Speech recognition not supported by this browser');
+            return false;
+        }
+    }
+
+    // Interim results can arrive several times a frame; only the latest one is written
+    let pendingTranscript = null;
+    let pendingTranscriptFinal = false;
+    function scheduleTranscriptWrite(text, isFinal) {
+        if (pendingTranscript === null) {
+            requestAnimationFrame(writeTranscript);
+        }
+        pendingTranscript = text;
+        pendingTranscriptFinal = pendingTranscriptFinal || isFinal;
+    }
+    
+    function writeTranscript() {
+        const text = pendingTranscript;
+        const isFinal = pendingTranscriptFinal;
+        pendingTranscript = null;
+        pendingTranscriptFinal = false;
+        
+        if (text.length !== chatInput.value.length || text !== chatInput.value) {
+            chatInput.value = text;
+            adjustTextareaHeight();
+        }
+        if (isFinal) {
+            updateSendButtonState();
+        }
+    }
+    
+    // Toggle speech recognition
+    function toggleSpeechRecognition() {
+        // One recognizer is created on first use and reused after that
+        if (!recognition && !setupSpeechRecognition()) {
+            addBotErrorMessage('Speech recognition is not supported by your browser');
+            return;
+        }
+        
+        if (isListening) {
+            recognition.stop();
+        } else {
+            recognition.start();
+        }
+    }
+
+    // Toggle auto-play responses
+    function toggleAutoPlayResponses() {
+        autoPlayResponses = !autoPlayResponses;
+        
+        if (autoPlayResponses) {
+            autoPlayBtn.classList.add('active');
+            autoPlayBtn.title = 'Auto-play responses: ON';
+        } else {
+            autoPlayBtn.classList.remove('active');
+            autoPlayBtn.title = 'Auto-play responses: OFF';
+        }
+    }
+});